@@ -1,19 +1,25 @@
 from __future__ import annotations
+import sys
 import json
 import weakref
+from functools import partial
+from itertools import count
 from threading import Thread, Lock, Event
-from collections import defaultdict
-from typing import Any
+from typing import Any, Callable
 from pathlib import Path
 import zmq
 from zmq.utils.monitor import recv_monitor_message
 from .namespace import DISCOSNamespace
-from .utils import rand_id, get_auth_keys, timestamp
+from .utils import rand_id, get_auth_keys, timestamp, json_loads
+from .utils import parse_format_spec
 from .initializer import NSInitializer
 
 
 __all__ = ["DISCOSClient", "SRTClient", "MedicinaClient", "NotoClient"]
 
+# Unique suffixes for the inproc addresses, the ZMQ context is process-wide
+_inproc_ids = count()
+
 DEFAULT_SUB_PORT = 16000
 DEFAULT_REQ_PORT = 16010
 
@@ -25,6 +31,9 @@ class DISCOSClient:
     to send remote commands.
     """
 
+    # Maximum number of messages handled before checking the stop event
+    __max_batch__ = 64
+
     def __init__(
         self,
         *topics: str,
@@ -55,11 +64,16 @@ class DISCOSClient:
         """
         if telescope not in ("Medicina", "Noto", "SRT", None):
             raise ValueError(f"Unknown telescope: '{telescope}'")
-        self._initializer = NSInitializer(telescope)
-        self._topics = self.__validate_topics__(self._initializer, topics)
+        self._initializer = NSInitializer.get_instance(telescope)
+        # Topics become attribute names, interning them speeds up lookups
+        self._topics = [
+            sys.intern(topic)
+            for topic in self.__validate_topics__(self._initializer, topics)
+        ]
         self._client_id = rand_id()
         self._stop = Event()
-        self._context = zmq.Context()
+        # All the clients share the process-wide context and its I/O thread
+        self._context = zmq.Context.instance()
 
         self._events = {}
         self._events["stop"] = self._stop
@@ -70,18 +84,49 @@ class DISCOSClient:
         self._sub.setsockopt(zmq.CONNECT_TIMEOUT, 500)
         self._sub.connect(f"tcp://{address}:{sub_port}")
 
+        # Pair of inproc sockets used to wake the receiver up on cleanup,
+        # so that it can block on the poller instead of periodically waking
+        wake_address = f"inproc://discos_client_wake_{next(_inproc_ids)}"
+        self._wake_rx = self._context.socket(zmq.PAIR)
+        self._wake_rx.setsockopt(zmq.LINGER, 0)
+        self._wake_rx.bind(wake_address)
+        self._wake_tx = self._context.socket(zmq.PAIR)
+        self._wake_tx.setsockopt(zmq.LINGER, 0)
+        self._wake_tx.connect(wake_address)
+
         self._sockets = {}
         self._sockets["sub"] = self._sub
-
-        self._locks = defaultdict(Lock)
+        self._sockets["wake_rx"] = self._wake_rx
+        self._sockets["wake_tx"] = self._wake_tx
+
+        # The receiver dispatches on the raw topic frames, keep bytes keys.
+        # Namespaces are updated in place and never rebound, every node
+        # guards its own state, so no per-topic lock is needed
+        self._namespaces: dict[bytes, DISCOSNamespace] = {}
+        self._topic_names = {
+            topic.encode("ascii"): topic for topic in self._topics
+        }
+        # Namespaces are built on first access, either by the user or by the
+        # receiver, this lock makes sure each one of them is built only once
+        self._init_lock = Lock()
+        # Format representations, stamped with the namespaces update counter
+        self._format_cache: dict[str, tuple[int, str]] = {}
 
         self._receiver = Thread(
             target=self.__receive__,
             args=(
                 self._sub,
-                self._locks,
-                self._client_id,
-                self.__dict__,
+                self._wake_rx,
+                self._client_id.encode("ascii"),
+                self._namespaces,
+                self._topic_names,
+                partial(
+                    self.__init_topic__,
+                    self._initializer,
+                    self._init_lock,
+                    self.__dict__,
+                    self._namespaces
+                ),
                 self._stop
             ),
             daemon=True
@@ -92,8 +137,7 @@ class DISCOSClient:
             self.__cleanup__,
             self._stop,
             self._receiver,
-            self._sockets,
-            self._context
+            self._sockets
         )
 
         if identity is not None:
@@ -114,12 +158,52 @@ class DISCOSClient:
             self.__init_req_socket__(f"tcp://{address}:{req_port}")
             self.command = self.__command__
 
-        for topic in self._topics:
-            self.__dict__[topic] = self._initializer.initialize(topic)
-
-        self._receiver.start()
+        # ZMQ sockets are not thread safe and the receiver keeps polling the
+        # SUB socket, so subscribe before handing it over
         for topic in self._topics:
             self._sub.subscribe(f"{self._client_id}{topic}")
+        self._receiver.start()
+
+    def __getattr__(self, name: str) -> DISCOSNamespace:
+        """
+        Builds the namespace of a topic the first time it is accessed.
+
+        :param name: The name of the attribute being accessed.
+        :return: The namespace of the requested topic.
+        :raises AttributeError: If the attribute is not a known topic.
+        """
+        if name in self.__dict__.get("_topics", ()):
+            return self.__init_topic__(
+                self._initializer,
+                self._init_lock,
+                self.__dict__,
+                self._namespaces,
+                name
+            )
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute, dropping the cached format representations.
+
+        :param name: The attribute name.
+        :param value: The attribute value.
+        """
+        super().__setattr__(name, value)
+        cache = self.__dict__.get("_format_cache")
+        if cache:
+            cache.clear()
+
+    def __dir__(self) -> list[str]:
+        """
+        Extends the list of available attributes with the client topics,
+        including the ones whose namespace has not been built yet.
+
+        :return: Sorted list of attribute names.
+        """
+        return sorted(set(super().__dir__()).union(self._topics))
 
     def __command__(self, cmd: str, *args) -> DISCOSNamespace:
         """
@@ -147,7 +231,7 @@ class DISCOSClient:
 
         while self.__req_connected__(strict=True):
             if (self._req.poll(10) & zmq.POLLIN) != 0:
-                answer <<= json.loads(self._req.recv_string())
+                answer <<= json_loads(self._req.recv())
                 return answer
 
         # We lost connection between send and receive, we need to reinitialize
@@ -173,6 +257,8 @@ class DISCOSClient:
         self._mon = self._req.get_monitor_socket()
         self._online = Event()
         self._events["online"] = self._online
+        # Set until the outcome of the first connection attempt is known
+        self._connecting = True
         self._req.connect(endpoint)
         self._sockets["req"] = self._req
         self._sockets["mon"] = self._mon
@@ -183,9 +269,10 @@ class DISCOSClient:
         topics: tuple[str]
     ) -> list[str]:
         valid_topics = initializer.get_topics()
-        invalid = [t for t in topics if t not in valid_topics]
+        valid_set = frozenset(valid_topics)
+        invalid = [t for t in topics if t not in valid_set]
         if not invalid:
-            return topics or valid_topics
+            return list(topics) if topics else valid_topics
 
         if len(invalid) > 1:
             invalid = f"""s '{"', '".join(invalid[:-1])}'""" \
@@ -199,22 +286,51 @@ class DISCOSClient:
             f"'{valid_topics[-1]}'"
         )
 
+    @staticmethod
+    def __init_topic__(
+        initializer: NSInitializer,
+        lock: Lock,
+        d: dict[str, Any],
+        namespaces: dict[bytes, DISCOSNamespace],
+        topic: str
+    ) -> DISCOSNamespace:
+        """
+        Returns the namespace of the given topic, building it if needed.
+
+        :param initializer: The NSInitializer object that builds namespaces.
+        :param lock: The Lock object that serializes namespaces creation.
+        :param d: The client __dict__ object.
+        :param namespaces: The namespaces dictionary, keyed by encoded topic.
+        :param topic: The name of the topic.
+        :return: The namespace of the topic.
+        """
+        with lock:
+            namespace = d.get(topic)
+            if namespace is None:
+                namespace = initializer.initialize(topic)
+                namespaces[topic.encode("ascii")] = namespace
+                d[topic] = namespace
+            return namespace
+
     @staticmethod
     def __cleanup__(
         stop: Event,
         receiver: Thread,
-        sockets: dict[str, zmq.Socket],
-        context: zmq.Context
+        sockets: dict[str, zmq.Socket]
     ) -> None:
         """
-        Joins the updater thread and closes the ZMQ sockets and context.
+        Joins the updater thread and closes the ZMQ sockets. The ZMQ context
+        is shared among all the clients, so it is left open.
 
         :param stop: the Event object that will stop the updater thread.
-        :param sub: the ZMQ SUB socket object.
-        :param context: the ZMQ context object.
-        :param updater: the updater thread object.
+        :param receiver: the updater thread object.
+        :param sockets: the ZMQ sockets, including the wake up PAIR socket.
         """
         stop.set()
+        try:
+            sockets["wake_tx"].send(b"", zmq.NOBLOCK)
+        except zmq.ZMQError:  # pragma: no cover
+            pass
         try:
             receiver.join()
         except RuntimeError:  # pragma: no cover
@@ -222,36 +338,76 @@ class DISCOSClient:
         for _, socket in sockets.items():
             socket.disable_monitor()
             socket.close()
-        context.term()
 
     @staticmethod
     def __receive__(
         sub: zmq.Socket,
-        locks: dict[str, Lock],
-        client_id: str,
-        namespaces: dict[str, DISCOSNamespace],
+        wake: zmq.Socket,
+        client_id: bytes,
+        namespaces: dict[bytes, DISCOSNamespace],
+        topic_names: dict[bytes, str],
+        init_topic: Callable[[str], DISCOSNamespace],
         stop: Event
     ) -> None:
         """
         Loops continuously waiting for new ZMQ messages.
 
-        :param socket: The ZMQ socket object.
-        :param locks: The locks dictionary, used for thread synchronization.
-        :param client_id: The random string identifying the client.
-        :param d: The client __dict__ object.
-        :param event: The Event object that will break the receiver loop.
+        :param sub: The ZMQ SUB socket object.
+        :param wake: The ZMQ PAIR socket that signals the loop to stop.
+        :param client_id: The random prefix identifying the client.
+        :param namespaces: The namespaces dictionary, keyed by encoded topic.
+        :param topic_names: The topic names, keyed by encoded topic.
+        :param init_topic: The function that builds the namespace of a topic.
+        :param stop: The Event object that will break the receiver loop.
         """
-        while not stop.is_set():
-            if (sub.poll(10) & zmq.POLLIN) != 0:
-                t, p = sub.recv_multipart()  # noqa
-                t = t.decode("ascii")
-                if t.startswith(client_id):
+        poller = zmq.Poller()
+        poller.register(sub, zmq.POLLIN)
+        poller.register(wake, zmq.POLLIN)
+        # Topics still waiting for their prefixed initial message
+        pending = set(topic_names)
+        # Local bindings for the names used in the loop below
+        poll = poller.poll
+        recv = sub.recv_multipart
+        get_namespace = namespaces.get
+        is_set = stop.is_set
+        loads = json_loads
+        again = zmq.Again
+        noblock = zmq.NOBLOCK
+        batch = range(DISCOSClient.__max_batch__)
+        id_len = len(client_id)
+        while not is_set():
+            if sub not in dict(poll(1000)):
+                continue
+            # Drain the queued messages without polling again for each one,
+            # every message is applied so observers see every update
+            for _ in batch:
+                try:
+                    t, p = recv(noblock, copy=False)
+                except again:
+                    break
+                t = t.bytes
+                if pending and t.startswith(client_id):
                     sub.unsubscribe(t)
-                    t = t[len(client_id):]
+                    t = t[id_len:]
                     sub.subscribe(t)
-                p = json.loads(p)
-                with locks[t]:
-                    namespaces[t] <<= p
+                    pending.discard(t)
+                namespace = get_namespace(t)
+                if namespace is None:
+                    topic = topic_names.get(t)
+                    if topic is None:
+                        # Subscriptions are prefix matches, skip unknown ones
+                        continue
+                    namespace = init_topic(topic)
+                try:
+                    p = loads(p.buffer)
+                except ValueError:
+                    # orjson rejects the NaN and Infinity tokens that the
+                    # json module accepts, a malformed message is skipped
+                    try:
+                        p = json.loads(p.bytes)
+                    except ValueError:
+                        continue
+                namespace <<= p
 
     def __req_connected__(self, strict: bool = False) -> bool:
         """
@@ -263,14 +419,22 @@ class DISCOSClient:
         :return: A boolean indicating where the REQ socket is connected.
         """
         disconnection_detected = False
-        while self._mon.poll(0) & zmq.POLLIN:
+        # A freshly created socket may still be connecting, wait up to the
+        # connection timeout instead of reporting the server as unreachable
+        wait = self._connecting
+        self._connecting = False
+        while self._mon.poll(500 if wait else 0) & zmq.POLLIN:
             msg = recv_monitor_message(self._mon)
             event = msg["event"]
             if event == zmq.EVENT_CONNECTED:
                 self._online.set()
+                wait = False
             elif event in (zmq.EVENT_DISCONNECTED, zmq.EVENT_CLOSED):
                 self._online.clear()
                 disconnection_detected = True
+                wait = False
+            elif event == zmq.EVENT_CONNECT_RETRIED:
+                wait = False
         currently_online = self._online.is_set()
         if strict:
             return currently_online and not disconnection_detected
@@ -321,57 +485,30 @@ with optional indentation level <n> (default is 2)
             | 'e' - entire representation with metadata
             | 'm' - metadata only representation
 
+        The representation is cached per specifier and reused until a
+        namespace is updated, either by the receiver or in place with
+        ``<<=``, or an attribute of the client is assigned.
+
         :return: A JSON formatted string.
         :raises ValueError: If the given format specifier is not known or
                             contains errors.
         """
-        has_e = "e" in spec
-        has_m = "m" in spec
-
-        if has_e and has_m:
-            raise ValueError(
-                "Format specifier cannot contain both 'e' and 'm'."
-            )
-
-        if has_e:
-            fmt_spec = spec[1:] if spec.startswith("e") else spec
-            fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("e") else fmt_spec
-        elif has_m:
-            fmt_spec = spec[1:] if spec.startswith("m") else spec
-            fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("m") else fmt_spec
-        else:
-            fmt_spec = spec
-
-        indent = None
-        separators = None
+        version = DISCOSNamespace.__updates__[0]
+        cached = self._format_cache.get(spec)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        kind, _, indent, separators = parse_format_spec(
+            spec,
+            self.__class__.__name__
+        )
         default = (
-            DISCOSNamespace.__full_dict__ if has_e
-            else DISCOSNamespace.__metadata_dict__ if has_m
+            DISCOSNamespace.__full_dict__ if kind == "e"
+            else DISCOSNamespace.__metadata_dict__ if kind == "m"
             else DISCOSNamespace.__message_dict__
         )
 
-        if fmt_spec == "":
-            pass
-        elif fmt_spec == "t":
-            separators = (",", ":")
-        elif fmt_spec.endswith("i"):
-            fmt_par = fmt_spec[:-1]
-            indent = 2
-            if fmt_par:
-                try:
-                    indent = int(fmt_par)
-                except ValueError as exc:
-                    raise ValueError(
-                        f"Invalid indent in format spec: '{fmt_spec[:-1]}'"
-                    ) from exc
-                if indent <= 0:
-                    raise ValueError("Indentation must be a positive integer")
-        else:
-            raise ValueError(
-                f"Unknown format code '{spec}' for {self.__class__.__name__}"
-            )
-
-        return json.dumps(
+        result = json.dumps(
             self.__public_dict__(),
             default=default,
             indent=indent,
@@ -379,6 +516,8 @@ with optional indentation level <n> (default is 2)
             sort_keys=True,
             ensure_ascii=False
         )
+        self._format_cache[spec] = (version, result)
+        return result
 
     def __public_dict__(self) -> dict[str, DISCOSNamespace]:
         """
@@ -388,15 +527,7 @@ with optional indentation level <n> (default is 2)
         :return: A dictionary containing the pairs of topics and
                  DISCOSNamespaces with last received statuses
         """
-        result: dict[str, DISCOSNamespace] = {}
-        for topic in self._topics:
-            self._locks[topic].acquire()
-        for topic in self._topics:
-            ns = self.__dict__.get(topic)
-            result[topic] = ns
-        for topic in self._topics:
-            self._locks[topic].release()
-        return result
+        return {topic: getattr(self, topic) for topic in self._topics}
 
 
 class SRTClient(DISCOSClient):
@@ -1,16 +1,20 @@
 from __future__ import annotations
-import re
-import json
+import posixpath
+import threading
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from importlib.resources import files
-from collections.abc import Iterable
-from .utils import META_KEYS
+from collections import deque
+from .utils import META_KEYS, json_loads
 from .namespace import DISCOSNamespace
 
 
 __all__ = ["NSInitializer"]
 
+# Read-only default for missing schema sections, instead of a new {} per call
+_EMPTY: MappingProxyType = MappingProxyType({})
+
 
 class NSInitializer:
     """
@@ -18,49 +22,84 @@ class NSInitializer:
 
     This class loads all schema files under ``schemas/common`` and,
     optionally, ``schemas/<telescope>``, resolves and expands references,
-    merges ``allOf`` blocks, precompiles ``patternProperties`` and
-    builds a mapping between logical topic names and absolute schema IDs.
+    merges ``allOf`` blocks and builds a mapping between logical topic
+    names and absolute schema IDs.
 
     It finally provides :meth:`initialize`, which constructs the initial
     `DISCOSNamespace` tree for a topic, enriched with schema metadata
     and with all required/initialized fields present.
     """
 
+    _instances: dict[str | None, NSInitializer] = {}
+    _instances_lock = threading.Lock()
+
     def __init__(self, telescope: str | None = None):
         """
         Initialize the initializer and load all schemas from disk.
 
-        This sets up the schema dictionaries, expands references,
-        merges ``allOf`` and precompiles ``patternProperties`` for
-        both common and telescope-specific schemas.
+        This sets up the schema dictionaries, expands references and
+        merges ``allOf`` for both common and telescope-specific schemas.
 
         :param telescope: Optional telescope identifier; if provided, schemas
                           in the corresponding subdirectory are loaded in
                           addition to the common ones.
         """
         base_dir = files("discos_client") / "schemas"
-        self._pp_cache: \
-            dict[int, list[tuple[str, "re.Pattern", str, dict]]] = {}
+        self._payloads: dict[str, dict[str, Any]] = {}
+        self._expanded_refs: dict[str, dict[str, Any]] = {}
+        self._merged_nodes: dict[int, tuple[Any, Any]] = {}
+        self._interned_nodes: dict[tuple, dict | list] = {}
+        self._active_keys: dict[int, tuple[dict, frozenset[str]]] = {}
+        self._stripped_schemas: dict[int, tuple[dict, dict]] = {}
+        self._meta_items: dict[int, tuple[dict, tuple]] = {}
         self.schemas, definitions, self.node_to_id = \
             self._load_schemas(base_dir, telescope)
 
         for def_id, definition in definitions.items():
-            definition = self._absolutize_refs(definition, base_dir, def_id)
             definition = self._expand_refs(definition, definitions)
             definition = self._merge_all_of(definition)
-            self._precompile_patternprops(definition)
             definitions[def_id] = definition
 
         for schema_id, schema in self.schemas.items():
-            schema = self._absolutize_refs(schema, base_dir, schema_id)
             schema = self._expand_refs(schema, definitions)
             schema = self._merge_all_of(schema)
             schema.pop("$defs", None)
-            self._precompile_patternprops(schema)
+            schema = self._intern_nodes(schema)
             self.schemas[schema_id] = schema
 
-        self.available_topics = list(self.node_to_id.keys())
-        self.available_topics.remove("command_answer")
+        # Only needed while normalizing, release the references they hold
+        self._expanded_refs.clear()
+        self._merged_nodes.clear()
+        self._interned_nodes.clear()
+
+        # Instances are shared between clients, keep these read-only
+        self.node_to_id = MappingProxyType(self.node_to_id)
+        self.available_topics = tuple(
+            topic for topic in self.node_to_id if topic != "command_answer"
+        )
+
+    @classmethod
+    def get_instance(cls, telescope: str | None = None) -> NSInitializer:
+        """
+        Return the initializer for the given telescope, creating it once.
+
+        Loading and normalizing the schemas is by far the most expensive part
+        of a client construction, while its outcome only depends on the
+        telescope. The initializer is never modified after loading, so a
+        single instance can be shared among all the clients. Concurrent
+        callers wait for the first one to build it.
+
+        :param telescope: Optional telescope identifier, see :meth:`__init__`.
+        :return: The shared initializer for the given telescope.
+        """
+        instance = cls._instances.get(telescope)
+        if instance is None:
+            with cls._instances_lock:
+                instance = cls._instances.get(telescope)
+                if instance is None:
+                    instance = cls(telescope)
+                    cls._instances[telescope] = instance
+        return instance
 
     def initialize(
         self,
@@ -76,6 +115,10 @@ class NSInitializer:
         * Metadata fields copied from the schema.
         * Proper structure for objects, arrays and primitives.
 
+        The initial payload only depends on the schema, so it is built once
+        per topic and then reused, since :class:`DISCOSNamespace` never
+        modifies the containers it is built from.
+
         :param topic: Logical topic name (schema ``node`` value).
         :return: A fully initialized namespace tree ready to receive updates.
         :raises ValueError: If the topic does not correspond to a loaded
@@ -85,7 +128,10 @@ class NSInitializer:
             raise ValueError(f"Schema '{topic}' was not loaded.")
         node_id = self.node_to_id[topic]
         schema = self.schemas[node_id]
-        payload = self._initialize_from_schema(schema)
+        payload = self._payloads.get(node_id)
+        if payload is None:
+            payload = self._initialize_from_schema(schema)
+            self._payloads[node_id] = payload
         return DISCOSNamespace(
             schema=schema,
             node_name=topic,
@@ -97,99 +143,9 @@ class NSInitializer:
         """
         Return the list of available logical topic names.
 
-        :return: All topic names loaded from schema files.
-        """
-        return self.available_topics
-
-    def _literal_prefix(self, pat: str) -> str:
-        """
-        Extract the literal prefix of a regex pattern.
-
-        The prefix consists of non-metacharacter characters up to the first
-        special symbol and is used to optimize ``patternProperties`` matching.
-
-        :param pat: Regular expression pattern.
-        :return: Literal prefix extracted from the pattern.
-        """
-        i = 0
-        if pat.startswith('^'):
-            i = 1
-        out = []
-        meta = set('.^$*+?[]{}()|\\')
-        while i < len(pat):
-            c = pat[i]
-            if c in meta:
-                break
-            out.append(c)  # pragma: no cover
-            i += 1  # pragma: no cover
-        return ''.join(out)
-
-    def _precompile_patternprops(self, obj: dict | list) -> None:
-        """
-        Recursively scan a schema and precompile its ``patternProperties``.
-
-        Compiled entries are cached to avoid repeated regex compilation.
-
-        :param obj: Schema object to inspect.
-        """
-        for d in self._walk_dicts(obj):
-            pp = d.get("patternProperties")
-            if not isinstance(pp, dict) or not pp:
-                continue
-            key = id(pp)
-            if key not in self._pp_cache:
-                self._pp_cache[key] = self._build_pp_list(pp)
-
-    def _walk_dicts(self, root: dict | list) -> Iterable[dict]:
+        :return: A new list of all topic names loaded from schema files.
         """
-        Walk a nested schema structure and yield all dictionaries it contains.
-
-        The traversal is depth-first and follows both dictionary values
-        and list elements.
-
-        :param root: Root schema object (dictionary or list) to traverse.
-        :return: An iterator yielding all nested dictionaries.
-        """
-        stack: list[dict | list] = [root]
-        while stack:
-            cur = stack.pop()
-            if isinstance(cur, dict):
-                yield cur
-                for v in cur.values():
-                    if isinstance(v, (dict, list)):
-                        stack.append(v)
-            elif isinstance(cur, list):
-                for v in cur:
-                    if isinstance(v, (dict, list)):
-                        stack.append(v)
-
-    def _build_pp_list(
-        self,
-        pp: dict
-    ) -> list[tuple[str, re.Pattern | None, str, dict]]:
-        """
-        Converts a ``patternProperties`` dictionary into a list of compiled
-        entries.
-
-        Each entry contains:
-        * the raw pattern
-        * the compiled regex (or ``None`` if invalid)
-        * the literal prefix
-        * the associated property schema
-
-        :param pp: Dictionary of raw patternProperties.
-
-        :return: Precompiled patternProperties entries.
-        """
-        compiled: list[tuple[str, re.Pattern | None, str, dict]] = []
-        for pat, pschema in pp.items():
-            try:
-                rx = re.compile(pat)
-            except re.error:  # pragma: no cover
-                rx = None
-            pref = self._literal_prefix(pat)
-            compiled.append((pat, rx, pref, pschema))
-        return compiled
+        return list(self.available_topics)
 
     def _load_schemas(
         self,
@@ -226,18 +182,21 @@ class NSInitializer:
             raise FileNotFoundError(f"{definitions_dir} not found")
         for f in definitions_dir.iterdir():
             if f.is_file() and f.name.endswith(".json"):
-                rel_path = f.resolve().relative_to(base_dir).as_posix()
-                schema = json.loads(f.read_text(encoding="utf-8"))
-                self._absolutize_refs(schema, base_dir, rel_path)
+                rel_path = f.relative_to(base_dir).as_posix()
+                raw = f.read_bytes()
+                schema = json_loads(raw)
+                if b'"$ref"' in raw:
+                    self._absolutize_refs(schema, base_dir, rel_path)
                 schema_id = schema.get("$id", rel_path)
                 definitions[schema_id] = schema
         for d in schemas_dirs:
             for f in d.iterdir():
                 if f.is_file() and f.name.endswith(".json"):
-                    rel_path = \
-                        f.resolve().relative_to(base_dir).as_posix()
-                    schema = json.loads(f.read_text(encoding="utf-8"))
-                    self._absolutize_refs(schema, base_dir, rel_path)
+                    rel_path = f.relative_to(base_dir).as_posix()
+                    raw = f.read_bytes()
+                    schema = json_loads(raw)
+                    if b'"$ref"' in raw:
+                        self._absolutize_refs(schema, base_dir, rel_path)
                     schema_id = schema.get("$id", rel_path)
                     node_name = schema.get("node")
                     if not node_name:  # pragma: no cover
@@ -266,20 +225,24 @@ class NSInitializer:
                              relative to ``base_dir``.
         :return: The same schema dictionary, with normalized ``$ref`` values.
         """
-        def recurse(obj: Any):
-            if isinstance(obj, dict):
-                if "$ref" in obj:
-                    obj["$ref"] = self._normalize_ref(
-                        obj["$ref"],
+        current_path = Path(current_file)
+        normalize = self._normalize_ref
+        containers = (dict, list)
+        stack: deque[dict | list] = deque((schema,))
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            cur = pop()
+            if isinstance(cur, dict):
+                if "$ref" in cur:
+                    cur["$ref"] = normalize(
+                        cur["$ref"],
                         base_dir,
-                        Path(current_file)
+                        current_path
                     )
-                for v in obj.values():
-                    recurse(v)
-            elif isinstance(obj, list):
-                for item in obj:
-                    recurse(item)
-        recurse(schema)
+                extend(v for v in cur.values() if type(v) in containers)
+            else:
+                extend(v for v in cur if type(v) in containers)
         return schema
 
     def _normalize_ref(
@@ -297,25 +260,26 @@ class NSInitializer:
           the current file and base directory.
         * Optional fragments appended to the resolved path.
 
+        Paths are normalized lexically, the packaged schemas contain no
+        symbolic links, so there is no need to query the file system.
+
         :param ref: Raw reference string as found in the schema.
         :param base_dir: Base directory containing all schemas.
-        :param current_file: Path of the file that owns the reference.
+        :param current_file: Path of the file that owns the reference,
+                             relative to ``base_dir``.
         :return: Normalized reference string suitable for dictionary lookups.
+        :raises ValueError: If the reference points outside ``base_dir``.
         """
         if ref.startswith("#"):
             return f"{current_file.as_posix()}{ref}"
-        current_file = base_dir / current_file
-        current_dir = current_file.parent
         ref_path, _, fragment = ref.partition("#")
-        ref_path = Path(ref_path)
-        if ".." in ref_path.as_posix():
-            current_ref = current_dir / ref_path
-            base_dir = base_dir.resolve()
-            current_ref = current_ref.resolve()
-            result = current_ref.relative_to(base_dir)
+        if ".." in ref_path:
+            current_dir = posixpath.dirname(current_file.as_posix())
+            result = posixpath.normpath(posixpath.join(current_dir, ref_path))
+            if result == ".." or result.startswith("../"):
+                raise ValueError(f"'{ref}' is not inside '{base_dir}'")
         else:
-            result = ref_path
-        result = result.as_posix()
+            result = Path(ref_path).as_posix()
         return f"{result}#{fragment}" if fragment else result
 
     def _expand_refs(
@@ -326,7 +290,10 @@ class NSInitializer:
         """
         Recursively resolve all ``$ref`` occurrences inside a schema.
 
-        Referenced definitions are merged with inline overrides.
+        Referenced definitions are merged with inline overrides. Each
+        definition is expanded only once and the expansion is then shared
+        among all the references pointing to it. Containers without
+        references are updated in place rather than rebuilt.
 
         :param schema: Schema containing references.
         :param definitions: Mapping of absolute definition identifiers to their
@@ -334,21 +301,35 @@ class NSInitializer:
         :return: Schema with all references expanded.
         :raises ValueError: If a ``$ref`` cannot be resolved.
         """
+        expanded_refs = self._expanded_refs
+
         def recurse(obj: Any):
             if isinstance(obj, dict):
                 if "$ref" in obj:
                     ref = obj["$ref"]
-                    resolved = definitions.get(ref)
-                    if not resolved:  # pragma: no cover
-                        raise ValueError(f"Unresolved $ref: {ref}")
-                    merged = {
-                        **resolved,
-                        **{k: v for k, v in obj.items() if k != "$ref"}
-                    }
-                    return recurse(merged)
-                return {k: recurse(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [recurse(item) for item in obj]
+                    expanded = expanded_refs.get(ref)
+                    if expanded is None:
+                        resolved = definitions.get(ref)
+                        if not resolved:  # pragma: no cover
+                            raise ValueError(f"Unresolved $ref: {ref}")
+                        expanded = recurse(resolved)
+                        expanded_refs[ref] = expanded
+                    if len(obj) == 1:
+                        return expanded
+                    merged = dict(expanded)
+                    for k, v in obj.items():
+                        if k != "$ref":
+                            merged[k] = recurse(v)
+                    return merged
+                for k, v in obj.items():
+                    new = recurse(v)
+                    if new is not v:
+                        obj[k] = new
+            elif isinstance(obj, list):
+                for i, item in enumerate(obj):
+                    new = recurse(item)
+                    if new is not item:
+                        obj[i] = new
             return obj
         return recurse(schema)
 
@@ -358,19 +339,42 @@ class NSInitializer:
 
         ``properties`` and ``patternProperties`` are combined,
         ``required`` fields are unioned, and ``initialize`` arrays are merged.
+        Subtrees shared by multiple parents (e.g. expanded references) are
+        merged only once and their result is shared as well. Containers
+        without ``allOf`` are updated in place rather than rebuilt.
 
         :param schema: Schema object containing ``allOf`` blocks.
         :return: Schema with all ``allOf`` sections flattened.
         """
+        # Maps id(obj) to (obj, result), keeping obj alive so that its id
+        # cannot be reused by another object while normalizing
+        memo = self._merged_nodes
+
         def recurse(obj: Any):
-            if isinstance(obj, dict):
-                if "allOf" in obj:
-                    merged = self._merge_subschemas(obj["allOf"])
-                    return recurse(merged)
-                return {k: recurse(v) for k, v in obj.items()}
+            if not isinstance(obj, (dict, list)):
+                return obj
+            done = memo.get(id(obj))
+            if done is not None:
+                return done[1]
             if isinstance(obj, list):
-                return [recurse(item) for item in obj]
-            return obj
+                for i, item in enumerate(obj):
+                    new = recurse(item)
+                    if new is not item:
+                        obj[i] = new
+                result = obj
+            elif "allOf" in obj:
+                # Children first, so the merged fragments are already flat
+                result = self._merge_subschemas(
+                    [recurse(subschema) for subschema in obj["allOf"]]
+                )
+            else:
+                for k, v in obj.items():
+                    new = recurse(v)
+                    if new is not v:
+                        obj[k] = new
+                result = obj
+            memo[id(obj)] = (obj, result)
+            return result
         return recurse(schema)
 
     def _merge_subschemas(
@@ -388,21 +392,24 @@ class NSInitializer:
         * Copies any other keys, letting later subschemas override
           earlier ones.
 
-        :param subschemas: List of schema fragments to merge.
+        :param subschemas: List of schema fragments to merge, whose own
+                           ``allOf`` blocks have already been merged.
         :return: A single schema representing the merged subschemas.
         """
-        merged: dict[str, Any] = {}
+        if not subschemas:  # pragma: no cover
+            return {}
+        properties: dict[str, Any] = {}
+        pattern_properties: dict[str, Any] = {}
+        merged: dict[str, Any] = {
+            "properties": properties,
+            "patternProperties": pattern_properties,
+        }
         required_fields: set[str] = set()
         initialize_fields: set[str] = set()
         for subschema in subschemas:
-            subschema = self._merge_all_of(subschema)
-            merged.setdefault("properties", {}).update(
-                subschema.get("properties", {})
-            )
-            merged.setdefault("patternProperties", {}).update(
-                subschema.get("patternProperties", {})
-            )
-            required_fields.update(subschema.get("required", []))
+            properties |= subschema.get("properties", _EMPTY)
+            pattern_properties |= subschema.get("patternProperties", _EMPTY)
+            required_fields.update(subschema.get("required", ()))
             init_list = subschema.get("initialize")
             if isinstance(init_list, list):
                 for key in init_list:
@@ -419,6 +426,48 @@ class NSInitializer:
             merged["initialize"] = list(sorted(initialize_fields))
         return merged
 
+    def _intern_nodes(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """
+        Replace structurally equal dictionaries and lists of a schema with a
+        single shared instance, across all the loaded schemas.
+
+        Children are interned before their parents, so two nodes are equal if
+        they hold the same keys, in the same order, and the very same
+        (interned) children. This makes the comparison key cheap to build.
+        Interned nodes must never be modified.
+
+        :param schema: Normalized schema, with all references expanded and
+                       ``allOf`` blocks merged.
+        :return: The interned schema.
+        """
+        table = self._interned_nodes
+        # Maps id(obj) to (obj, result) for nodes shared by multiple parents
+        seen: dict[int, tuple[Any, Any]] = {}
+
+        def key_of(value: Any) -> Any:
+            if isinstance(value, (dict, list)):
+                return id(value)
+            return (type(value), value)
+
+        def recurse(obj: Any) -> Any:
+            if not isinstance(obj, (dict, list)):
+                return obj
+            done = seen.get(id(obj))
+            if done is not None:
+                return done[1]
+            if isinstance(obj, dict):
+                result = {k: recurse(v) for k, v in obj.items()}
+                key = (dict,) + tuple(
+                    (k, key_of(v)) for k, v in result.items()
+                )
+            else:
+                result = [recurse(v) for v in obj]
+                key = (list,) + tuple(key_of(v) for v in result)
+            result = table.setdefault(key, result)
+            seen[id(obj)] = (obj, result)
+            return result
+        return recurse(schema)
+
     def _replace_patterns_with_properties(
         self,
         schema: dict[str, Any],
@@ -429,7 +478,8 @@ class NSInitializer:
 
         If no message data is available, any ``patternProperties`` section
         is removed from the returned schema copy. Otherwise the schema
-        is left unchanged.
+        is left unchanged. The copy is built once per schema node and then
+        reused, so that caches keyed on schema nodes keep working on it.
 
         :param schema: Schema object that may contain ``patternProperties``.
         :param message: Message payload used to decide whether patterns should
@@ -437,13 +487,17 @@ class NSInitializer:
         :return: The original schema or a shallow copy without
                  ``patternProperties``.
         """
-        pp = schema.get("patternProperties")
-        if not pp or not message:
-            if "patternProperties" in schema:
-                out = dict(schema)
-                out.pop("patternProperties", None)
-                return out
-        return schema
+        if "patternProperties" not in schema:
+            return schema
+        if message and schema["patternProperties"]:
+            return schema
+        entry = self._stripped_schemas.get(id(schema))
+        if entry is None:
+            out = dict(schema)
+            del out["patternProperties"]
+            entry = (schema, out)
+            self._stripped_schemas[id(schema)] = entry
+        return entry[1]
 
     def _enrich_properties(
         self,
@@ -463,35 +517,56 @@ class NSInitializer:
         :return: A dictionary mapping property names to enriched values.
         """
         schema = self._replace_patterns_with_properties(schema, values)
-        properties = schema.get("properties", {})
-        required = set(schema.get("required", []))
-        initialize = set(schema.get("initialize", []))
+        properties = schema.get("properties", _EMPTY)
+        active = self._get_active_keys(schema)
         result: dict[str, Any] = {}
         for key, prop_schema in properties.items():
-            if key in required.union(initialize) or key in values:
+            if key in active or key in values:
                 prop_schema = self._replace_patterns_with_properties(
                     prop_schema,
-                    values.get(key, {})
+                    values.get(key, _EMPTY)
                 )
                 result[key] = self._enrich_named_property(
                     key, prop_schema, values
                 )
         return result
 
+    def _get_active_keys(self, schema: dict[str, Any]) -> frozenset[str]:
+        """
+        Return the ``required`` and ``initialize`` fields of an object schema.
+
+        The set is computed once per schema node and then cached. The cache
+        also holds a reference to the node itself, so that its ``id`` cannot
+        be reused by another object.
+
+        :param schema: Object schema definition.
+        :return: The union of the ``required`` and ``initialize`` fields.
+        """
+        entry = self._active_keys.get(id(schema))
+        if entry is None:
+            active = frozenset(schema.get("required", ())).union(
+                schema.get("initialize", ())
+            )
+            entry = (schema, active)
+            self._active_keys[id(schema)] = entry
+        return entry[1]
+
     def _meta(self, d: dict[str, Any]) -> dict[str, Any]:
         """
         Extract metadata keys from a schema dictionary.
 
-        Only keys listed in :data:`META_KEYS` are preserved.
+        Only keys listed in :data:`META_KEYS` are preserved. The entries are
+        collected once per schema node and then cached, like the active keys
+        of :meth:`_get_active_keys`.
 
         :param d: Source dictionary, typically a schema fragment.
-        :return: Dictionary containing only the metadata entries.
+        :return: New dictionary containing only the metadata entries.
         """
-        return {
-            k: d[k]
-            for k in META_KEYS
-            if k in d
-        }
+        entry = self._meta_items.get(id(d))
+        if entry is None:
+            entry = (d, tuple((k, d[k]) for k in META_KEYS if k in d))
+            self._meta_items[id(d)] = entry
+        return dict(entry[1])
 
     def _without(self, d: dict[str, Any], *keys: str) -> dict[str, Any]:
         """
@@ -571,24 +646,44 @@ class NSInitializer:
                        object.
         :return: Enriched representation for the property.
         """
-        value = values.get(key, None)
-        t = schema.get("type")
+        handler = self._enrich_handlers.get(
+            schema.get("type"),
+            NSInitializer._enrich_leaf
+        )
+        return handler(self, schema, values.get(key))
+
+    def _enrich_leaf(
+        self,
+        leaf_schema: dict[str, Any],
+        leaf_value: Any
+    ) -> dict[str, Any]:
+        """
+        Enrich a primitive-typed property according to its schema.
 
-        if t == "object":
-            return self._enrich_object(schema, value)
-        if t == "array":
-            return self._enrich_array(schema, value)
-        out = self._meta(schema)
-        out["value"] = value
+        :param leaf_schema: Schema definition for the property.
+        :param leaf_value: Current value for the property.
+        :return: Metadata of the property, with its ``value`` field.
+        """
+        out = self._meta(leaf_schema)
+        out["value"] = leaf_value
         return out
 
+    # Enrichment helper for each structured schema type, any other type is
+    # handled by ``_enrich_leaf``
+    _enrich_handlers = {
+        "object": _enrich_object,
+        "array": _enrich_array,
+    }
+
     def _collect_init_keys(
         self,
         schema: dict[str, Any]
     ) -> tuple[set[str], set[str]]:
         """
-        Recursively collect all ``required`` and ``initialize`` fields declared
-        in a schema, including those defined inside ``anyOf`` branches.
+        Collect all ``required`` and ``initialize`` fields declared in a
+        schema, including those defined inside (nested) ``anyOf`` branches.
+
+        The ``anyOf`` branches are visited with an explicit stack.
 
         :param schema: A JSON Schema object, potentially containing ``anyOf``
                        branches and local ``required`` / ``initialize``
@@ -596,16 +691,17 @@ class NSInitializer:
         :return: A tuple where each element is a set of field names
                  aggregated from the entire schema hierarchy.
         """
-        required: set[str] = set(schema.get("required", []))
-        initialize: set[str] = set(schema.get("initialize", []))
+        required: set[str] = set()
+        initialize: set[str] = set()
 
-        any_of = schema.get("anyOf")
-        if isinstance(any_of, list):
-            for alt in any_of:
-                if isinstance(alt, dict):
-                    r_alt, i_alt = self._collect_init_keys(alt)
-                    required |= r_alt
-                    initialize |= i_alt
+        stack: list[dict[str, Any]] = [schema]
+        while stack:
+            cur = stack.pop()
+            required.update(cur.get("required", ()))
+            initialize.update(cur.get("initialize", ()))
+            any_of = cur.get("anyOf")
+            if isinstance(any_of, list):
+                stack.extend(alt for alt in any_of if isinstance(alt, dict))
 
         return required, initialize
 
@@ -660,7 +756,7 @@ class NSInitializer:
         :param key: Name of the property to look for.
         :return: The matching property schema, or ``None`` if not found.
         """
-        props = schema.get("properties", {})
+        props = schema.get("properties", _EMPTY)
         if key in props:
             return props[key]
         any_of = schema.get("anyOf")
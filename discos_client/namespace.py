@@ -1,16 +1,22 @@
 from __future__ import annotations
-import re
+import sys
 import json
 import threading
-from copy import deepcopy
 from collections.abc import Iterable
 from typing import Any, Callable, Iterator
 from .utils import delegated_operations, delegated_comparisons
-from .utils import public_dict, META_KEYS
+from .utils import public_dict, parse_format_spec, META_KEYS
+from .utils import META_KEY_SET
+from .utils import key_fullmatch
 
 
 __all__ = ["DISCOSNamespace"]
 
+# Returned by lookups of the internal value on nodes that do not hold one
+_NO_VALUE = object()
+# Keyword arguments stored as the internal value of a node
+_VALUE_KEYS = frozenset(("items", "value"))
+
 
 @delegated_operations('__value_operation__')
 @delegated_comparisons('__value_comparison__')
@@ -24,7 +30,7 @@ class DISCOSNamespace:
     """
 
     __typename__ = "DISCOSNamespace"
-    __private__ = (
+    __private__ = frozenset((
         "_lock",
         "_observers",
         "_observers_lock",
@@ -36,7 +42,20 @@ class DISCOSNamespace:
         "unbind",
         "wait",
         "copy"
-    )
+    ))
+    # Keys left out of the pure message dictionary
+    __message_skip__ = __private__ | META_KEY_SET
+    # Bumped whenever any namespace changes, tells the holders of cached
+    # representations whether they are still current
+    __updates__ = [0]
+    # Public methods exposed by reactive objects, resolved on access so that
+    # each node does not have to store its own bound methods
+    __reactive_methods__ = {
+        "bind": "__bind__",
+        "copy": "__copy__",
+        "unbind": "__unbind__",
+        "wait": "__wait__",
+    }
 
     def __init__(
         self,
@@ -65,12 +84,6 @@ class DISCOSNamespace:
         object.__setattr__(self, "_node_name", node_name)
         object.__setattr__(self, "_reactive", reactive)
 
-        if reactive:
-            object.__setattr__(self, "bind", self.__bind__)
-            object.__setattr__(self, "copy", self.__copy__)
-            object.__setattr__(self, "unbind", self.__unbind__)
-            object.__setattr__(self, "wait", self.__wait__)
-
         meta: dict[str, Any] = {}
         if schema is not None:
             for mk in META_KEYS:
@@ -79,27 +92,23 @@ class DISCOSNamespace:
         self.__dict__.update(meta)
 
         clean_kwargs: dict[str, Any] = {}
-        for k, v in list(kwargs.items()):
-            if k in ["items", "value"]:
-                clean_kwargs["_value"] = self._wrap_value(
-                    v,
-                    schema,
-                    k,
-                    reactive
-                )
+        wrap = self._wrap_value
+        find_subschema = self._find_subschema
+        for k, v in kwargs.items():
+            if k in _VALUE_KEYS:
+                clean_kwargs["_value"] = wrap(v, schema, k, reactive)
             else:
                 subschema = None
                 if not k.startswith("_"):
-                    subschema = self._find_subschema(schema, k)
-                clean_kwargs[k] = self._wrap_value(
+                    subschema = find_subschema(schema, k)
+                # Shared by all the nodes built from the same schema
+                clean_kwargs[sys.intern(k)] = wrap(
                     v,
                     subschema,
                     k,
                     reactive
                 )
         self.__dict__.update(clean_kwargs)
-        if self.__has_value__(self) and not self.__is__(self._value):
-            object.__setattr__(self, "get_value", self.__get_value__)
 
     @staticmethod
     def _find_subschema(
@@ -123,11 +132,8 @@ class DISCOSNamespace:
 
         pprops = schema.get("patternProperties", {})
         for pat, pschema in pprops.items():
-            try:
-                if re.fullmatch(pat, key):
-                    return pschema
-            except re.error:  # pragma: no cover
-                continue
+            if key_fullmatch(pat, key):
+                return pschema
 
         any_of = schema.get("anyOf")
         if isinstance(any_of, list):
@@ -279,8 +285,7 @@ class DISCOSNamespace:
 
         :return: a deep copy of the instance.
         """
-        with self._lock:
-            return deepcopy(self)
+        return self.__deepcopy__({})
 
     def __value_operation__(self, operation: Callable[[Any], Any]) -> Any:
         """
@@ -290,10 +295,11 @@ class DISCOSNamespace:
         :return: Result of applying the operation to the internal value.
         :raises TypeError: If the object does not hold a primitive value.
         """
-        if self.__has_value__(self) and \
-                not DISCOSNamespace.__is__(self._value):
-            with self._lock:
-                return operation(self._value)
+        with self._lock:
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE and \
+                    not isinstance(value, DISCOSNamespace):
+                return operation(value)
         raise TypeError(
             f"{self.__typename__} supports operations "
             "only when holding a primitive value"
@@ -331,8 +337,9 @@ class DISCOSNamespace:
                 )
             except TypeError:
                 return False
-        if DISCOSNamespace.__has_value__(self):
-            return op(self._value, other)
+        value = self.__dict__.get("_value", _NO_VALUE)
+        if value is not _NO_VALUE:
+            return op(value, other)
         return NotImplemented
 
     def __repr__(self) -> str:
@@ -342,8 +349,9 @@ class DISCOSNamespace:
         :return: Unanbiguous string representation of the instance.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return repr(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return repr(value)
             return f"<{self.__typename__}({self.__value_repr__(self)})>"
 
     def __str__(self) -> str:
@@ -353,8 +361,9 @@ class DISCOSNamespace:
         :return: Human readable string representation of the instance.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return str(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return str(value)
             return format(self, "")
 
     def __int__(self) -> int:
@@ -366,8 +375,9 @@ class DISCOSNamespace:
                            be converted to integer.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return int(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return int(value)
         raise TypeError(
             f"{self.__typename__} object cannot be converted to int"
         )
@@ -381,8 +391,9 @@ class DISCOSNamespace:
                            be converted to float.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return float(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return float(value)
         raise TypeError(
             f"{self.__typename__} object cannot be converted to float"
         )
@@ -396,8 +407,9 @@ class DISCOSNamespace:
                            a numeric type.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return -self._value
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return -value
         raise TypeError(
             f"{self.__typename__} object cannot be negated"
         )
@@ -411,8 +423,9 @@ class DISCOSNamespace:
                            a numeric type.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return abs(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return abs(value)
         raise TypeError(
             f"{self.__typename__} object is not a numeric type."
         )
@@ -427,8 +440,9 @@ class DISCOSNamespace:
                            be rounded.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return round(self._value, n)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return round(value, n)
         raise TypeError(
             f"{self.__typename__} object cannot be rounded."
         )
@@ -441,8 +455,9 @@ class DISCOSNamespace:
         :raises TypeError: If the instance has no internal value.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return bool(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return bool(value)
         raise TypeError(
             f"{self.__typename__} object cannot be converted to bool"
         )
@@ -456,8 +471,9 @@ class DISCOSNamespace:
         :raises TypeError: If not subscriptable.
         """
         with self._lock:
-            if self.__has_value__(self) and isinstance(self._value, Iterable):
-                return self._value[item]
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if isinstance(value, Iterable):
+                return value[item]
         raise TypeError(f"{self.__typename__} object is not subscriptable")
 
     def __len__(self) -> int:
@@ -469,8 +485,9 @@ class DISCOSNamespace:
                            length.
         """
         with self._lock:
-            if self.__has_value__(self):
-                return len(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if value is not _NO_VALUE:
+                return len(value)
         raise TypeError(f"{self.__typename__} object has no length")
 
     def __iter__(self) -> Iterator[Any]:
@@ -481,8 +498,9 @@ class DISCOSNamespace:
         :raises TypeError: If the internal value is not iterable.
         """
         with self._lock:
-            if self.__has_value__(self) and isinstance(self._value, Iterable):
-                return iter(self._value)
+            value = self.__dict__.get("_value", _NO_VALUE)
+            if isinstance(value, Iterable):
+                return iter(value)
         raise TypeError(f"{self.__typename__} object is not iterable")
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -524,14 +542,15 @@ class DISCOSNamespace:
 
         notify = False
 
-        if DISCOSNamespace.__is__(other):
-            notify = self._ilshift_namespace(other)
-        elif isinstance(other, dict):
+        # Most updates are decoded JSON payloads, check their types first
+        if isinstance(other, dict):
             notify = self._ilshift_dict(other)
-        elif isinstance(other, list):
-            notify = self._ilshift_list(other)
         elif isinstance(other, (bool, int, float, str)):
             notify = self._ilshift_value(other)
+        elif isinstance(other, DISCOSNamespace):
+            notify = self._ilshift_namespace(other)
+        elif isinstance(other, list):
+            notify = self._ilshift_list(other)
         else:
             raise TypeError(
                 f"Unsupported operand type for <<=: '{type(self).__name__}' "
@@ -576,8 +595,10 @@ class DISCOSNamespace:
                  or execute the bound callbacks.
         """
         notify = False
+        sdict = self.__dict__
+        ilshift_value = DISCOSNamespace._ilshift_value
         for k, v in other.items():
-            node = self.__dict__.get(k)
+            node = sdict.get(k)
             if node is None:
                 schema = DISCOSNamespace._find_subschema(self._schema, k)
                 node = DISCOSNamespace(
@@ -585,10 +606,15 @@ class DISCOSNamespace:
                     node_name=k,
                     reactive=self._reactive
                 )
-                self.__dict__[k] = node
+                sdict[k] = node
                 notify = True
-            if DISCOSNamespace.__is__(node):
-                node <<= v
+            if isinstance(node, DISCOSNamespace):
+                # Leaf values are merged directly, skipping the dispatch
+                if isinstance(v, (bool, int, float, str)):
+                    if ilshift_value(node, v):
+                        node.__notify__()
+                else:
+                    node <<= v
                 notify = True
         return notify
 
@@ -636,7 +662,6 @@ class DISCOSNamespace:
             sdict["_value"] = other
         return True
 
-    # pylint: disable=too-many-branches
     def __format__(self, spec: str) -> str:
         """
         Custom format method.
@@ -658,68 +683,34 @@ node key
         reserved = set("tiemw")
         is_container = any(c in spec for c in reserved)
 
-        if self.__has_value__(self) and not \
-                isinstance(self._value, (tuple, list)):
-            if not is_container:
-                with self._lock:
-                    return format(self._value, spec)
+        if not is_container:
+            with self._lock:
+                value = self.__dict__.get("_value", _NO_VALUE)
+                if value is not _NO_VALUE and \
+                        not isinstance(value, (tuple, list)):
+                    return format(value, spec)
+
+        kind, has_w, indent, separators = parse_format_spec(
+            spec,
+            self.__typename__,
+            wrap=True
+        )
 
-        has_e = "e" in spec
-        has_m = "m" in spec
-        has_w = "w" in spec
+        if has_w and self._node_name is None:
+            raise ValueError("Cannot wrap node without a key!")
 
-        if has_e and has_m:
-            raise ValueError(
-                "Format specifier cannot contain both 'e' and 'm'."
-            )
-
-        if has_e:
-            fmt_spec = spec[1:] if spec.startswith("e") else spec
-            fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("e") else fmt_spec
-        elif has_m:
-            fmt_spec = spec[1:] if spec.startswith("m") else spec
-            fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("m") else fmt_spec
-        else:
-            fmt_spec = spec
-
-        data_to_serialize = self
-        if has_w:
-            if self._node_name is None:
-                raise ValueError("Cannot wrap node without a key!")
-            data_to_serialize = {self._node_name: self}
-            fmt_spec = spec[1:] if spec.startswith("w") else spec
-            fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("w") else fmt_spec
-
-        indent = None
-        separators = None
         default = (
-            self.__full_dict__ if has_e
-            else self.__metadata_dict__ if has_m
+            self.__full_dict__ if kind == "e"
+            else self.__metadata_dict__ if kind == "m"
             else self.__message_dict__
         )
 
-        if fmt_spec == "":
-            pass
-        elif fmt_spec == "t":
-            separators = (",", ":")
-        elif fmt_spec.endswith("i"):
-            fmt_par = fmt_spec[:-1]
-            indent = 2
-            if fmt_par:
-                try:
-                    indent = int(fmt_par)
-                except ValueError as exc:
-                    raise ValueError(
-                        f"Invalid indent in format spec: '{fmt_spec[:-1]}'"
-                    ) from exc
-                if indent <= 0:
-                    raise ValueError("Indentation must be a positive integer")
-        else:
-            raise ValueError(
-                f"Unknown format code '{spec}' for {self.__typename__}"
-            )
-
         with self._lock:
+            # The whole tree is converted up front, so that the encoder does
+            # not have to call back into Python for every node
+            data_to_serialize = default(self)
+            if has_w:
+                data_to_serialize = {self._node_name: data_to_serialize}
             return json.dumps(
                 data_to_serialize,
                 default=default,
@@ -733,14 +724,51 @@ node key
         """
         Return a deep copy of the object.
 
+        The copy is built structurally, node by node, instead of going through
+        the JSON-like dictionary representation and the generic `deepcopy`
+        machinery. The schema and the node name are preserved, while bound
+        callbacks are not copied.
+
         :param memo: Internal memoization dictionary for deepcopy.
         :return: A new deepcopy of this object.
         """
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
         with self._lock:
             cls = self.__class__
-            public = cls.__full_dict__(self)
-            copied = deepcopy(public, memo)
-            return cls(reactive=self._reactive, **copied)
+            copied = cls(
+                schema=self._schema,
+                node_name=self._node_name,
+                reactive=self._reactive
+            )
+            memo[id(self)] = copied
+            target = copied.__dict__
+            for k, v in vars(self).items():
+                if k in cls.__private__:
+                    continue
+                target[k] = cls.__copy_value__(v, memo)
+            return copied
+
+    @classmethod
+    def __copy_value__(cls, value: Any, memo: dict[int, Any]) -> Any:
+        """
+        Return a deep copy of a value stored inside a DISCOSNamespace.
+
+        DISCOSNamespace objects and the tuples holding list items are copied.
+        Primitive values and the metadata taken from the schema as-is, such
+        as ``enum`` lists, are shared with the original, since nothing ever
+        mutates them.
+
+        :param value: The value to copy.
+        :param memo: Internal memoization dictionary for deepcopy.
+        :return: The copied value.
+        """
+        if cls.__is__(value):
+            return value.__deepcopy__(memo)
+        if isinstance(value, tuple):
+            return tuple(cls.__copy_value__(v, memo) for v in value)
+        return value
 
     @classmethod
     def __retrieve_value__(cls, obj: DISCOSNamespace) -> Any:
@@ -802,16 +830,19 @@ node key
         :param obj: The object to convert.
         :return: A dictionary with public fields.
         """
+        skip = cls.__message_skip__
+        retrieve = cls.__retrieve_value__
+
         def unwrap(value: Any) -> Any:
-            if cls.__is__(value):
-                if cls.__has_value__(value):
-                    return unwrap(cls.__retrieve_value__(value))
-                retval = {}
-                for k, v in vars(value).items():
-                    if k in cls.__private__ or k in META_KEYS:
-                        continue
-                    retval[k] = unwrap(v)
-                return retval
+            if isinstance(value, cls):
+                attributes = value.__dict__
+                if "_value" in attributes:
+                    return unwrap(retrieve(value))
+                return {
+                    k: unwrap(v)
+                    for k, v in attributes.items()
+                    if k not in skip
+                }
             if isinstance(value, (list, tuple)):
                 return [unwrap(v) for v in value]
             return value
@@ -843,23 +874,32 @@ node key
         :param obj: The object to represent.
         :return: A simplified structure with primitive values and lists.
         """
-        if cls.__is__(obj):
-            if cls.__has_value__(obj):
-                val = cls.__retrieve_value__(obj)
-                return cls.__value_repr__(val)
-            return {
-                k: cls.__value_repr__(v)
-                for k, v in vars(obj).items()
-                if not k.startswith("_") and k not in cls.__private__
-            }
-        if isinstance(obj, (tuple, list)):
-            return [cls.__value_repr__(v) for v in obj]
-        return obj
+        private = cls.__private__
+        retrieve = cls.__retrieve_value__
+
+        def represent(value: Any) -> Any:
+            if isinstance(value, cls):
+                attributes = value.__dict__
+                if "_value" in attributes:
+                    return represent(retrieve(value))
+                return {
+                    k: represent(v)
+                    for k, v in attributes.items()
+                    if not k.startswith("_") and k not in private
+                }
+            if isinstance(value, (tuple, list)):
+                return [represent(v) for v in value]
+            return value
+        return represent(obj)
 
     def __notify__(self) -> None:
         """
         Execute the bound callbacks, if are present
         """
+        DISCOSNamespace.__updates__[0] += 1
+        if not self._observers:
+            # Most nodes have no observers, avoid taking the lock for them
+            return
         with self._observers_lock:
             if not self._observers:
                 return
@@ -888,16 +928,23 @@ node key
         This method is invoked when an attribute is not found in the namespace
         itself. If the internal value is a primitive type, attribute access is
         forwarded to it, enabling calls like `node.endswith("x")` for string
-        values.
+        values. The `bind`, `copy`, `unbind`, `wait` and `get_value` methods
+        are resolved here as well, when available.
 
         :param name: Name of the attribute  being accessed.
         :return: The corresponding attribute from the internal value.
         :raises AttributeError: If the attribute is not present.
         """
+        method = self.__reactive_methods__.get(name)
+        if method is not None and self._reactive:
+            return getattr(self, method)
         with self._lock:
-            if name not in self.__private__ and self.__has_value__(self):
+            if self.__has_value__(self):
                 value = self._value
-                if hasattr(value, name):
+                if name == "get_value":
+                    if not self.__is__(value):
+                        return self.__get_value__
+                elif name not in self.__private__ and hasattr(value, name):
                     return getattr(value, name)
 
             raise AttributeError(
@@ -916,7 +963,11 @@ node key
         :return: Sorted list of attribute names.
         """
         attrs = set(super().__dir__())
+        if self._reactive:
+            attrs.update(self.__reactive_methods__)
         if self.__has_value__(self):
             value = self._value
             attrs = set(dir(value)).union(attrs)
+            if not self.__is__(value):
+                attrs.add("get_value")
         return sorted(attrs)
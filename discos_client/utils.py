@@ -1,27 +1,63 @@
 from __future__ import annotations
+import re
 import operator
 import secrets
 import string
 import time
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Any, Callable
 from importlib.resources import files
 from pathlib import Path
 from zmq.auth import load_certificate
 from platformdirs import user_config_dir
+try:
+    # orjson parses bytes payloads noticeably faster than the standard library
+    # and it also accepts memoryview objects, avoiding an additional copy
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+    def json_loads(data: bytes | memoryview | str) -> Any:
+        """
+        Deserializes a JSON document, accepting memoryview objects as well.
+
+        :param data: The JSON document.
+        :return: The deserialized object.
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return _json_loads(data)
 
 
 __all__ = [
     "META_KEYS",
+    "META_KEY_SET",
+    "json_loads",
     "rand_id",
     "delegated_operations",
     "delegated_comparisons",
     "public_dict",
+    "parse_format_spec",
+    "compile_key_pattern",
+    "key_fullmatch",
     "get_auth_keys",
     "timestamp"
 ]
 
 META_KEYS = ("type", "title", "description", "format", "unit", "enum")
+# Same keys, for membership tests, while META_KEYS keeps the output order
+META_KEY_SET = frozenset(META_KEYS)
+_ID_ALPHABET = string.digits + string.ascii_letters
+
+# Trivial patternProperties patterns, matched without the regex engine
+_LITERAL = r"[^.^$*+?\[\]{}()|\\]"
+_ANY_PATTERN = re.compile(r"\^?\.\*\$?")
+_NONEMPTY_PATTERN = re.compile(r"\^?\.\+\$?")
+_LITERAL_PATTERN = re.compile(rf"\^?({_LITERAL}*)\$?")
+_CHOICE_PATTERN = re.compile(
+    rf"\^?\((?:\?:)?({_LITERAL}+(?:\|{_LITERAL}+)*)\)\$?"
+)
 
 
 def rand_id():
@@ -33,9 +69,7 @@ def rand_id():
 
     :return: The random ID string.
     """
-    _id = "".join(
-        secrets.choice(string.digits + string.ascii_letters) for _ in range(4)
-    )
+    _id = "".join(secrets.choice(_ID_ALPHABET) for _ in range(4))
 
     return f"{_id}_"
 
@@ -104,6 +138,129 @@ def delegated_comparisons(handler: str) -> Callable[[type], type]:
     return decorator
 
 
+@lru_cache(maxsize=64)
+def parse_format_spec(
+    spec: str,
+    typename: str,
+    wrap: bool = False
+) -> tuple[str, bool, int | None, tuple[str, str] | None]:
+    """
+    Parses a JSON format specifier, caching the result since the same few
+    specifiers are used over and over.
+
+    :param spec: The format specifier, see `DISCOSNamespace.__format__`.
+    :param typename: The name of the formatted type, used in error messages.
+    :param wrap: Whether the 'w' (wrap) specifier is supported.
+    :return: A tuple containing the representation kind ('e' for entire,
+             'm' for metadata only, '' for message only), whether the
+             representation should be wrapped, and the indent and separators
+             arguments to be passed to `json.dumps`.
+    :raises ValueError: If the format specifier is unknown or malformed.
+    """
+    has_e = "e" in spec
+    has_m = "m" in spec
+    has_w = wrap and "w" in spec
+
+    if has_e and has_m:
+        raise ValueError(
+            "Format specifier cannot contain both 'e' and 'm'."
+        )
+
+    if has_e:
+        fmt_spec = spec[1:] if spec.startswith("e") else spec
+        fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("e") else fmt_spec
+    elif has_m:
+        fmt_spec = spec[1:] if spec.startswith("m") else spec
+        fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("m") else fmt_spec
+    else:
+        fmt_spec = spec
+
+    if has_w:
+        fmt_spec = spec[1:] if spec.startswith("w") else spec
+        fmt_spec = fmt_spec[:-1] if fmt_spec.endswith("w") else fmt_spec
+
+    indent = None
+    separators = None
+
+    if fmt_spec == "":
+        pass
+    elif fmt_spec == "t":
+        separators = (",", ":")
+    elif fmt_spec.endswith("i"):
+        fmt_par = fmt_spec[:-1]
+        indent = 2
+        if fmt_par:
+            try:
+                indent = int(fmt_par)
+            except ValueError as exc:
+                raise ValueError(
+                    f"Invalid indent in format spec: '{fmt_spec[:-1]}'"
+                ) from exc
+            if indent <= 0:
+                raise ValueError("Indentation must be a positive integer")
+    else:
+        raise ValueError(f"Unknown format code '{spec}' for {typename}")
+
+    kind = "e" if has_e else "m" if has_m else ""
+    return kind, has_w, indent, separators
+
+
+@lru_cache(maxsize=None)
+def compile_key_pattern(pattern: str) -> tuple[str, Any]:
+    """
+    Classifies a ``patternProperties`` pattern, so that keys can be matched
+    against the most common pattern shapes without using the regex engine.
+
+    :param pattern: The regular expression pattern.
+    :return: A tuple containing the kind of the pattern and its argument:
+
+        | ('any', None) - any key, e.g. '.*'
+        | ('nonempty', None) - any non empty key, e.g. '^.+$'
+        | ('literal', str) - a single literal key, e.g. '^foo$'
+        | ('choice', frozenset) - a set of literal keys, e.g. '^(a|b)$'
+        | ('regex', re.Pattern) - any other valid pattern
+        | ('invalid', None) - a pattern that does not compile
+    """
+    if _ANY_PATTERN.fullmatch(pattern):
+        return "any", None
+    if _NONEMPTY_PATTERN.fullmatch(pattern):
+        return "nonempty", None
+    match = _LITERAL_PATTERN.fullmatch(pattern)
+    if match:
+        return "literal", match.group(1)
+    match = _CHOICE_PATTERN.fullmatch(pattern)
+    if match:
+        return "choice", frozenset(match.group(1).split("|"))
+    try:
+        return "regex", re.compile(pattern)
+    except re.error:
+        return "invalid", None
+
+
+def key_fullmatch(pattern: str, key: str) -> bool:
+    """
+    Checks whether a key fully matches a ``patternProperties`` pattern,
+    with the same outcome as ``re.fullmatch``.
+
+    :param pattern: The regular expression pattern.
+    :param key: The key to be matched.
+    :return: True if the key matches the pattern, False otherwise, or if the
+             pattern is not a valid regular expression.
+    """
+    kind, arg = compile_key_pattern(pattern)
+    if kind == "literal":
+        return key == arg
+    if kind == "choice":
+        return key in arg
+    if kind == "regex":
+        return arg.fullmatch(key) is not None
+    if kind == "any":
+        return "\n" not in key
+    if kind == "nonempty":
+        return bool(key) and "\n" not in key
+    return False
+
+
 def public_dict(
     obj: Any,
     is_fn: Callable,
@@ -1,6 +1,7 @@
 import json
 import unittest
 import time
+import math
 import re
 import asyncio
 import sys
@@ -294,6 +295,53 @@ class TestDISCOSClient(unittest.TestCase):
         )
         self.assertNotIn("\": ", f"{client:t}")
 
+    def test_lazy_topics(self):
+        client = DISCOSClient(
+            address="127.0.0.1",
+            sub_port=DEFAULT_SUB_PORT
+        )
+        self.assertNotIn("antenna", vars(client))
+        self.assertIn("antenna", dir(client))
+        antenna = client.antenna
+        self.assertIsInstance(antenna, DISCOSNamespace)
+        self.assertIs(antenna, client.antenna)
+        self.assertIn("antenna", vars(client))
+        with self.assertRaises(AttributeError):
+            _ = client.foo
+
+    def test_non_finite_values(self):
+        with TestPublisher() as publisher:
+            publisher.messages["antenna"]["FWHM"] = float("nan")
+            publisher.messages["antenna"]["rawAzimuth"] = float("inf")
+            client = DISCOSClient(
+                address="127.0.0.1",
+                sub_port=DEFAULT_SUB_PORT
+            )
+            start = time.time()
+            while client.antenna.rawAzimuth.get_value() is None \
+                    and (time.time() - start) < 10:
+                time.sleep(0.01)
+            self.assertTrue(math.isinf(client.antenna.rawAzimuth))
+            self.assertTrue(math.isnan(client.antenna.FWHM))
+            del client
+
+    def test_format_cache(self):
+        client = DISCOSClient(
+            address="127.0.0.1",
+            sub_port=DEFAULT_SUB_PORT
+        )
+        first = f"{client:t}"
+        self.assertEqual(first, f"{client:t}")
+        # A held reference, so that no client attribute gets assigned
+        antenna = client.antenna
+        antenna <<= {"observedAzimuth": 123.0}
+        second = f"{client:t}"
+        self.assertNotEqual(first, second)
+        antenna = json.loads(second)["antenna"]
+        self.assertEqual(antenna["observedAzimuth"], 123.0)
+        client.antenna = DISCOSNamespace(value=1)
+        self.assertEqual(json.loads(f"{client:t}")["antenna"], 1)
+
     def test_bind(self):
         with TestPublisher("SRT"):
             client = DISCOSClient(
@@ -385,16 +433,20 @@ class TestDISCOSClient(unittest.TestCase):
     def test_command(self, mock_load_cert):
         mock_load_cert.return_value = (dummy_public, dummy_secret)
         with TestPublisher(router=True):
-            client = DISCOSClient(
-                address="127.0.0.1",
-                sub_port=DEFAULT_SUB_PORT,
-                req_port=DEFAULT_REQ_PORT,
-                telescope="SRT",
-                identity="identity"
-            )
-            self.assertTrue(hasattr(client, "command"))
-            answer = client.command("dummy")
-            self.assertTrue(answer.executed)
+            # Every command is sent right after construction, before the
+            # REQ socket could have finished its first connection
+            for topics in ((), ("antenna",)):
+                client = DISCOSClient(
+                    *topics,
+                    address="127.0.0.1",
+                    sub_port=DEFAULT_SUB_PORT,
+                    req_port=DEFAULT_REQ_PORT,
+                    telescope="SRT",
+                    identity="identity"
+                )
+                self.assertTrue(hasattr(client, "command"))
+                answer = client.command("dummy")
+                self.assertTrue(answer.executed)
 
     @patch("discos_client.utils.load_certificate")
     def test_command_with_args(self, mock_load_cert):
@@ -506,6 +558,15 @@ class TestTelescopeClients(unittest.TestCase):
     def test_noto_client(self):
         _ = NotoClient()
 
+    def test_shared_initializer(self):
+        first = SRTClient()
+        second = SRTClient()
+        self.assertIs(first._initializer, second._initializer)
+        self.assertIsNot(first._initializer, NotoClient()._initializer)
+        topics = first._initializer.get_topics()
+        topics.clear()
+        self.assertTrue(second._initializer.get_topics())
+
 
 if __name__ == '__main__':
     unittest.main()
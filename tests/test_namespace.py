@@ -168,6 +168,18 @@ class TestDISCOSNamespace(unittest.TestCase):
         ns = DISCOSNamespace(**d)
         ns2 = deepcopy(ns)
         self.assertFalse(ns2 is ns)
+        self.assertFalse(ns2.a.b is ns.a.b)
+        self.assertEqual(f"{ns2:e}", f"{ns:e}")
+        self.assertEqual(list(ns2.a.b), ["a", "b"])
+
+    def test_deepcopy_preserves_node(self):
+        d = {"value": [{"b": 1}, {"b": 2}], "title": "a"}
+        ns = DISCOSNamespace(node_name="a", **d)
+        ns2 = deepcopy(ns)
+        self.assertEqual(f"{ns2:w}", f"{ns:w}")
+        self.assertEqual(f"{ns2:e}", f"{ns:e}")
+        self.assertFalse(ns2[0] is ns[0])
+        self.assertEqual(ns2[1].b, 2)
 
     def test_format(self):
         a = 1.234
@@ -287,6 +299,28 @@ class TestDISCOSNamespace(unittest.TestCase):
             "Unsupported operand type for <<=: 'DISCOSNamespace' and 'bytes'"
         )
 
+    def test_pattern_properties(self):
+        schema = {
+            "type": "object",
+            "patternProperties": {
+                "^(TX|TY)$": {"title": "choice"},
+                "^foo$": {"title": "literal"},
+                "^[a-z]+[0-9]$": {"title": "regex"},
+                ".+": {"title": "nonempty"},
+            }
+        }
+        ns = DISCOSNamespace(schema=schema)
+        ns <<= {
+            "TX": {"value": 1},
+            "foo": {"value": 2},
+            "bar1": {"value": 3},
+            "TXX": {"value": 4}
+        }
+        self.assertEqual(ns.TX.title, "choice")
+        self.assertEqual(ns.foo.title, "literal")
+        self.assertEqual(ns.bar1.title, "regex")
+        self.assertEqual(ns.TXX.title, "nonempty")
+
     def test_comparison(self):
         a = 2
         ns = DISCOSNamespace(value=a)
@@ -311,6 +345,18 @@ class TestDISCOSNamespace(unittest.TestCase):
         attributes = dir(ns)
         self.assertNotIn("get_value", attributes)
 
+    def test_reactive_methods(self):
+        ns = DISCOSNamespace(a={"value": 1})
+        for name in ("bind", "copy", "unbind", "wait"):
+            self.assertNotIn(name, vars(ns))
+            self.assertIn(name, dir(ns))
+            self.assertTrue(callable(getattr(ns, name)))
+        self.assertEqual(ns, DISCOSNamespace(a={"value": 1}))
+        ns = DISCOSNamespace(reactive=False, a={"value": 1})
+        self.assertFalse(hasattr(ns, "bind"))
+        self.assertNotIn("bind", dir(ns))
+        self.assertEqual(ns.a.get_value(), 1)
+
     def test_getattr(self):
         ns = DISCOSNamespace(value="foo")
         self.assertEqual(ns.upper(), "foo".upper())